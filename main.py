@@ -1,14 +1,23 @@
 import os
 import pandas as pd
 import re
-from github import Github
-from itertools import cycle
 from dotenv import load_dotenv
 import time
-from urllib.parse import urlparse
+import queue
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from collections import deque
 import json
 
+from dependency_graph_analyzer import DEPS_JSON_FILE, DependencyGraphAnalyzer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 TOKENS = [
@@ -22,8 +31,6 @@ TOKENS = [
 if not all(TOKENS):
     raise ValueError("모든 토큰이 .env 파일에 정의되어 있어야 합니다.")
 
-token_cycle = cycle(TOKENS)
-
 # 베이스 디렉토리
 base_dir = "all_dependencies_tree"
 os.makedirs(base_dir, exist_ok=True)
@@ -31,7 +38,14 @@ os.makedirs(base_dir, exist_ok=True)
 # 전역 상태 관리
 processed_repos = set()
 failed_repos = set()
+claimed_repos = set()  # 작업자가 이미 가져간 리포지토리 (중복 다운로드 방지)
 dependency_graph = {}  # 의존성 그래프 저장
+state_lock = threading.Lock()  # 작업자 간 공유 상태 보호
+task_queue = queue.Queue()  # (github_url, root_repo_key, depth) 작업 큐
+completed_roots = 0
+root_pending_tasks = {}  # root_repo_key -> 아직 끝나지 않은 하위 트리 작업 수 (0이 되면 루트 완료)
+fetch_cache = {}  # repo_key -> {'oid': ..., 'etag': ..., 'path': ...} (반복 실행 시 변경 확인용)
+created_root_dirs = set()  # 이미 생성한 루트 디렉토리 (makedirs 반복 호출 방지)
 stats = {
     'total_repos': 0,
     'successful_downloads': 0,
@@ -41,9 +55,28 @@ stats = {
     'end_time': None
 }
 
-
-def get_github_instance():
-    return Github(next(token_cycle))
+# Package.swift 파싱용 정규식 (모듈 로드 시 한 번만 컴파일)
+_DEPS_RE = re.compile(r'dependencies:\s*\[(.*?)\]', re.DOTALL)
+_PKG_RE = re.compile(r'\.package\s*\(\s*(?:url:\s*)?["\'](?P<url>[^"\']+)["\'](?P<rest>[^)]*)\)', re.DOTALL)
+_NAME_RE = re.compile(r'name:\s*["\']([^"\']+)["\']')
+_BARE_VERSION_RE = re.compile(r'["\'](\d+\.\d+\.\d+[^"\']*)["\']')
+_VERSION_PATTERNS = [(constraint_type, re.compile(pattern)) for constraint_type, pattern in [
+    ('from', r'from:\s*["\']([^"\']+)["\']'),
+    ('upToNextMajor', r'\.upToNextMajor\s*\(\s*from:\s*["\']([^"\']+)["\']\s*\)'),
+    ('upToNextMinor', r'\.upToNextMinor\s*\(\s*from:\s*["\']([^"\']+)["\']\s*\)'),
+    ('exact', r'\.exact\s*\(\s*["\']([^"\']+)["\']\s*\)'),
+    ('range', r'["\']([^"\']+)["\'].+?["\']([^"\']+)["\']'),
+    ('closedRange', r'["\']([^"\']+)["\']\.\.\.["\']\s*([^"\']+)["\']'),
+    ('rangeOperator', r'["\']([^"\']+)["\']\s*\.\.\.?\s*["\']([^"\']+)["\']'),
+    ('branch', r'branch:\s*["\']([^"\']+)["\']'),
+    ('revision', r'revision:\s*["\']([^"\']+)["\']'),
+]]
+
+# GitHub API 설정
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_BATCH_SIZE = 50  # 한 번의 GraphQL 호출로 조회할 리포지토리 수
+CONTENTS_URL = "https://api.github.com/repos/{repo_key}/contents/Package.swift"
+FETCH_CACHE_FILE = "fetch_cache.json"
 
 
 def extract_repo_info(github_url):
@@ -51,8 +84,12 @@ def extract_repo_info(github_url):
     if github_url.endswith('.git'):
         github_url = github_url[:-4]
 
-    parsed = urlparse(github_url)
-    path_parts = parsed.path.strip('/').split('/')
+    # https://github.com/owner/repo 형태만 다루므로 urlparse 대신 문자열 분할 사용
+    _, separator, tail = github_url.rpartition('github.com/')
+    if not separator:
+        return None, None
+
+    path_parts = tail.strip('/').split('/', 2)
     if len(path_parts) >= 2:
         owner = path_parts[0]
         repo = path_parts[1]
@@ -60,82 +97,44 @@ def extract_repo_info(github_url):
     return None, None
 
 
-def get_default_branch(repository):
-    """리포지토리의 기본 브랜치 확인"""
-    try:
-        return repository.default_branch
-    except:
-        return None
-
-
 def extract_dependencies_from_content(content):
     """Package.swift 내용에서 dependencies 추출 (다양한 버전 제약 조건 포함)"""
     dependencies = []
 
     # dependencies 섹션 찾기
-    dependencies_pattern = r'dependencies:\s*\[(.*?)\]'
-    match = re.search(dependencies_pattern, content, re.DOTALL)
+    match = _DEPS_RE.search(content)
 
     if match:
-        deps_content = match.group(1)
-
-        # 다양한 .package 패턴들 찾기
-        package_patterns = [
-            # 기본 패턴: .package(url: "...", ...)
-            r'\.package\s*\(\s*url:\s*["\']([^"\']+)["\'][^)]*\)',
-            # 축약 패턴: .package("...", ...)
-            r'\.package\s*\(\s*["\']([^"\']+)["\'][^)]*\)',
-        ]
-
+        # .package 선언을 한 번만 훑으며 URL과 전체 구문을 함께 수집
         found_urls = set()  # 중복 제거
+        package_declarations = []
 
-        for pattern in package_patterns:
-            urls = re.findall(pattern, deps_content)
-            for url in urls:
-                if 'github.com' in url:
-                    found_urls.add(url)
+        for package_match in _PKG_RE.finditer(match.group(1)):
+            url = package_match.group('url')
+            if 'github.com' in url:
+                found_urls.add(url)
+                package_declarations.append((url, package_match.group(0)))
 
         dependencies = list(found_urls)
 
-        # 버전 정보도 함께 추출 (분석용)
-        if dependencies:
+        # 버전 정보도 함께 출력 (분석용)
+        if package_declarations:
             print(f"    🔍 발견된 의존성 패턴들:")
 
-            # .package 전체 구문들 찾기
-            full_package_pattern = r'\.package\s*\([^)]+\)'
-            package_declarations = re.findall(full_package_pattern, deps_content, re.DOTALL)
-
-            for i, decl in enumerate(package_declarations, 1):
-                # URL 추출
-                url_match = re.search(r'url:\s*["\']([^"\']+)["\']|["\']([^"\']+)["\']', decl)
-                if url_match:
-                    url = url_match.group(1) or url_match.group(2)
-                    if 'github.com' in url:
-                        # 버전 제약 조건 분석
-                        version_info = analyze_version_constraint(decl)
-                        print(f"      {i}. {url}")
-                        if version_info:
-                            print(f"         └─ 버전: {version_info}")
+            for i, (url, decl) in enumerate(package_declarations, 1):
+                # 버전 제약 조건 분석
+                version_info = analyze_version_constraint(decl)
+                print(f"      {i}. {url}")
+                if version_info:
+                    print(f"         └─ 버전: {version_info}")
 
     return dependencies
 
 
 def analyze_version_constraint(package_declaration):
     """Package 선언에서 버전 제약 조건 분석"""
-    version_patterns = {
-        'from': r'from:\s*["\']([^"\']+)["\']',
-        'upToNextMajor': r'\.upToNextMajor\s*\(\s*from:\s*["\']([^"\']+)["\']\s*\)',
-        'upToNextMinor': r'\.upToNextMinor\s*\(\s*from:\s*["\']([^"\']+)["\']\s*\)',
-        'exact': r'\.exact\s*\(\s*["\']([^"\']+)["\']\s*\)',
-        'range': r'["\']([^"\']+)["\'].+?["\']([^"\']+)["\']',
-        'closedRange': r'["\']([^"\']+)["\']\.\.\.["\']\s*([^"\']+)["\']',
-        'rangeOperator': r'["\']([^"\']+)["\']\s*\.\.\.?\s*["\']([^"\']+)["\']',
-        'branch': r'branch:\s*["\']([^"\']+)["\']',
-        'revision': r'revision:\s*["\']([^"\']+)["\']',
-    }
-
-    for constraint_type, pattern in version_patterns.items():
-        match = re.search(pattern, package_declaration)
+    for constraint_type, pattern in _VERSION_PATTERNS:
+        match = pattern.search(package_declaration)
         if match:
             if constraint_type == 'from':
                 return f"from {match.group(1)}"
@@ -158,7 +157,7 @@ def analyze_version_constraint(package_declaration):
                 return f"revision: {match.group(1)[:8]}..."
 
     # 기본적인 버전 문자열 찾기
-    version_match = re.search(r'["\'](\d+\.\d+\.\d+[^"\']*)["\']', package_declaration)
+    version_match = _BARE_VERSION_RE.search(package_declaration)
     if version_match:
         return f"version {version_match.group(1)}"
 
@@ -172,107 +171,368 @@ def create_directory_path(repo_key, root_repo_key):
     return os.path.join(base_dir, safe_root, safe_name)
 
 
-def download_package_swift(github_url, root_repo_key, depth=0):
-    """Package.swift 파일 다운로드 (완전 재귀 버전)"""
-    indent = "  " * min(depth, 10)  # 너무 많은 들여쓰기 방지
+def ensure_repo_dir(repo_dir):
+    """리포지토리 디렉토리 생성 (루트 디렉토리는 처음 한 번만 makedirs)"""
+    root_dir = os.path.dirname(repo_dir)
+    if root_dir not in created_root_dirs:
+        os.makedirs(root_dir, exist_ok=True)
+        created_root_dirs.add(root_dir)
 
-    try:
-        owner, repo = extract_repo_info(github_url)
-        if not owner or not repo:
-            return False
+    Path(repo_dir).mkdir(exist_ok=True)
+
+
+def claim_repo(github_url, depth=0):
+    """아직 처리되지 않은 리포지토리라면 선점하고 repo_key 반환 (확인과 등록을 원자적으로 수행)"""
+    owner, repo = extract_repo_info(github_url)
+    if not owner or not repo:
+        return None
 
-        repo_key = f"{owner}/{repo}"
+    repo_key = f"{owner}/{repo}"
 
-        # 이미 처리된 리포지토리인지 확인 (순환 참조 방지)
-        if repo_key in processed_repos or repo_key in failed_repos:
-            if depth > 0:  # 루트가 아닌 경우만 스킵 메시지
-                print(f"{indent}🔄 {repo_key}: 이미 처리됨 (깊이: {depth})")
-            return True
+    # 이미 처리된 리포지토리인지 확인 (순환 참조 방지)
+    with state_lock:
+        already_claimed = repo_key in claimed_repos
+        claimed_repos.add(repo_key)
 
-        print(f"{indent}🔍 [{len(processed_repos) + 1}] {repo_key} 처리 중... (깊이: {depth})")
+    if already_claimed:
+        if depth > 0:  # 루트가 아닌 경우만 스킵 메시지
+            indent = "  " * min(depth, 10)
+            print(f"{indent}🔄 {repo_key}: 이미 처리됨 (깊이: {depth})")
+        return None
 
-        g = get_github_instance()
-        repository = g.get_repo(repo_key)
+    return repo_key
+
+
+def fetch_package_swift_graphql(repo_keys, token):
+    """GraphQL 한 번의 호출로 여러 리포지토리의 Package.swift 내용 조회
+
+    기본 브랜치의 파일(HEAD:Package.swift)을 {'text': ..., 'oid': ...}로 담으며, 파일이 없으면 None을 담는다.
+    조회 자체에 실패한 리포지토리는 결과에서 빠지므로 REST 경로로 재시도해야 한다.
+
+    GraphQL은 조건부 요청을 지원하지 않아 변경이 없어도 본문은 매번 전송되지만,
+    50개당 한 번의 호출로 끝나므로 ETag 캐시가 있는 리포지토리도 묶음에 남겨 둔다.
+    대신 blob oid를 함께 받아 캐시와 같으면 파일 저장과 재파싱을 건너뛴다.
+    """
+    subqueries = []
+    for i, repo_key in enumerate(repo_keys):
+        owner, repo = repo_key.split('/', 1)
+        subqueries.append(
+            f'r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) '
+            '{ object(expression: "HEAD:Package.swift") { ... on Blob { oid text } } }'
+        )
+    query = "query {\n" + "\n".join(subqueries) + "\n}"
+
+    response = requests.post(
+        GRAPHQL_URL,
+        json={'query': query},
+        headers={'Authorization': f"bearer {token}"},
+        timeout=30
+    )
+    response.raise_for_status()
+    data = response.json().get('data') or {}
+
+    contents = {}
+    for i, repo_key in enumerate(repo_keys):
+        repository = data.get(f"r{i}")
+        if repository is None:
+            continue
+
+        blob = repository.get('object')
+        if blob is None:
+            contents[repo_key] = None
+        elif blob.get('text') is not None:
+            contents[repo_key] = blob
+
+    return contents
+
+
+def load_fetch_cache():
+    """이전 실행에서 저장한 blob oid / ETag 캐시 불러오기"""
+    cache_path = os.path.join(base_dir, FETCH_CACHE_FILE)
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            fetch_cache.update(json.load(f))
+
+
+def save_fetch_cache():
+    """다음 실행에서 변경 확인에 쓸 blob oid / ETag 캐시 저장"""
+    cache_path = os.path.join(base_dir, FETCH_CACHE_FILE)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(fetch_cache, f, indent=2)
+
+
+def get_cached_entry(repo_key):
+    """로컬 파일이 남아 있는 리포지토리의 캐시 엔트리 반환"""
+    with state_lock:
+        cached = fetch_cache.get(repo_key)
+    if cached and os.path.exists(cached['path']):
+        return cached
+    return None
+
+
+def fetch_package_swift_rest(token, repo_key):
+    """REST contents API로 기본 브랜치의 Package.swift 조회 (ETag 조건부 요청)
+
+    (내용 bytes, ETag)를 반환하며 파일이 없으면 내용은 None이다.
+    304 응답은 레이트 리밋을 소모하지 않으며, 이 경우 로컬에 저장된 파일을 그대로 사용한다.
+    """
+    headers = {
+        'Authorization': f"Bearer {token}",
+        'Accept': 'application/vnd.github.raw+json'
+    }
+    cached = get_cached_entry(repo_key)
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
 
-        # 브랜치 시도
-        branches_to_try = []
-        default_branch = get_default_branch(repository)
-        if default_branch:
-            branches_to_try.append(default_branch)
+    # ref 없이 조회하면 서버가 기본 브랜치를 사용
+    response = requests.get(CONTENTS_URL.format(repo_key=repo_key), headers=headers, timeout=30)
 
-        for branch in ['main', 'master']:
-            if branch not in branches_to_try:
-                branches_to_try.append(branch)
+    if response.status_code == 304:
+        return Path(cached['path']).read_bytes(), cached['etag']
+    if response.status_code == 404:
+        return None, None
 
-        package_file = None
-        used_branch = None
+    response.raise_for_status()
+    return response.content, response.headers.get('ETag')
 
-        for branch in branches_to_try:
-            try:
-                package_file = repository.get_contents("Package.swift", ref=branch)
-                used_branch = branch
-                break
-            except:
-                continue
 
-        if package_file is None:
-            failed_repos.add(repo_key)
+def write_deps_json(repo_dir, content, dep_keys):
+    """Package.swift 옆에 패키지 이름과 (정렬·중복 제거된) 의존성 목록(deps.json) 저장"""
+    name_match = _NAME_RE.search(content)
+    deps_info = {
+        'package_name': name_match.group(1) if name_match else None,
+        'dependencies': dep_keys
+    }
+
+    with open(os.path.join(repo_dir, DEPS_JSON_FILE), 'w', encoding='utf-8') as f:
+        json.dump(deps_info, f, ensure_ascii=False)
+
+
+def download_package_swift(token, repo_key, root_repo_key, depth=0, prefetched=None):
+    """Package.swift 파일 저장 후 발견된 의존성 URL 목록 반환"""
+    indent = "  " * min(depth, 10)  # 너무 많은 들여쓰기 방지
+
+    try:
+        with state_lock:
+            claimed_count = len(claimed_repos)
+        print(f"{indent}🔍 [{claimed_count}] {repo_key} 처리 중... (깊이: {depth})")
+
+        # GraphQL로 미리 받은 내용이 없으면 REST(ETag 조건부 요청)로 조회
+        oid = etag = None
+        if prefetched is not None and repo_key in prefetched:
+            blob = prefetched[repo_key]
+            content = blob['text'] if blob else None
+            oid = blob['oid'] if blob else None
+            source = "GraphQL"
+        else:
+            content, etag = fetch_package_swift_rest(token, repo_key)
+            source = "REST"
+
+        # REST 응답은 bytes 그대로 저장하고, 파싱용 문자열로는 한 번만 디코딩
+        if isinstance(content, bytes):
+            raw_content = content
+            content = raw_content.decode('utf-8')
+        elif content is not None:
+            raw_content = content.encode('utf-8')
+
+        if content is None:
+            with state_lock:
+                failed_repos.add(repo_key)
             print(f"{indent}❌ {repo_key}: Package.swift 없음")
-            return False
+            return []
 
         # 디렉토리 생성
         repo_dir = create_directory_path(repo_key, root_repo_key)
-        os.makedirs(repo_dir, exist_ok=True)
+        ensure_repo_dir(repo_dir)
 
-        # Package.swift 파일 저장
+        # 이전 실행과 같은 위치에 같은 blob(oid) 또는 304 응답이면 변경 없음
         package_path = os.path.join(repo_dir, "Package.swift")
-        content = package_file.decoded_content.decode('utf-8')
+        cached = get_cached_entry(repo_key)
+        unchanged = (cached is not None and cached['path'] == package_path and
+                     ((oid and cached.get('oid') == oid) or (etag and cached.get('etag') == etag)))
+
+        # 변경이 없으면 이전 실행의 deps.json을 그대로 사용 (저장과 재파싱 생략)
+        # deps.json이 없거나 오래되었거나 손상되었으면 None이 되어 아래에서 다시 파싱
+        deps_info = DependencyGraphAnalyzer.read_deps_json(package_path) if unchanged else None
+        if deps_info is None:
+            Path(package_path).write_bytes(raw_content)
+
+        with state_lock:
+            processed_repos.add(repo_key)
+            stats['successful_downloads'] += 1
+            if unchanged:
+                fetch_cache[repo_key] = {'oid': oid or cached.get('oid'),
+                                         'etag': etag or cached.get('etag'),
+                                         'path': package_path}
+            elif oid or etag:
+                fetch_cache[repo_key] = {'oid': oid, 'etag': etag, 'path': package_path}
+
+        if unchanged:
+            print(f"{indent}✅ {repo_key} 변경 없음 ({source})")
+        else:
+            print(f"{indent}✅ {repo_key} 다운로드 완료 ({source})")
 
-        with open(package_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if deps_info is not None:
+            dep_keys = deps_info['dependencies']
+            dep_urls = [f"https://github.com/{dep_key}" for dep_key in dep_keys]
+        else:
+            # 의존성 추출
+            dependencies = extract_dependencies_from_content(content)
 
-        processed_repos.add(repo_key)
-        stats['successful_downloads'] += 1
+            # 같은 리포지토리를 가리키는 URL(.git 유무 등)은 한 번만 세고, deps.json과 같은 정렬 순서로 맞춤
+            dep_url_by_key = {}
+            for dep_url in dependencies:
+                dep_owner, dep_repo = extract_repo_info(dep_url)
+                if dep_owner and dep_repo:
+                    dep_url_by_key.setdefault(f"{dep_owner}/{dep_repo}", dep_url)
 
-        print(f"{indent}✅ {repo_key} 다운로드 완료 (브랜치: {used_branch})")
+            dep_keys = sorted(dep_url_by_key)
+            dep_urls = [dep_url_by_key[dep_key] for dep_key in dep_keys]
 
-        # 의존성 추출
-        dependencies = extract_dependencies_from_content(content)
+            # 분석기가 Package.swift를 다시 파싱하지 않도록 추출 결과를 함께 저장
+            write_deps_json(repo_dir, content, dep_keys)
 
-        if dependencies:
-            stats['dependencies_found'] += len(dependencies)
-            if repo_key not in dependency_graph:
-                dependency_graph[repo_key] = []
+        if not dep_keys:
+            print(f"{indent}📦 {repo_key}: 의존성 없음")
+            return []
 
-            print(f"{indent}📦 {repo_key}: {len(dependencies)}개 의존성 발견")
+        print(f"{indent}📦 {repo_key}: {len(dep_keys)}개 의존성 발견")
 
-            # 의존성 처리 (완전 재귀 - 제한 없음)
-            for i, dep_url in enumerate(dependencies, 1):
-                dep_owner, dep_repo = extract_repo_info(dep_url)
-                if dep_owner and dep_repo:
-                    dep_key = f"{dep_owner}/{dep_repo}"
-                    dependency_graph[repo_key].append(dep_key)
+        for i, dep_key in enumerate(dep_keys, 1):
+            print(f"{indent}  └─ {i}/{len(dep_keys)}: {dep_key}")
 
-                    print(f"{indent}  └─ {i}/{len(dependencies)}: {dep_key}")
+        # 간선은 항상 기록하고, 이미 선점된 의존성은 네트워크 요청 없이 여기서 바로 건너뜀
+        with state_lock:
+            stats['dependencies_found'] += len(dep_keys)
+            dependency_graph.setdefault(repo_key, []).extend(dep_keys)
+            new_dep_urls = [dep_url for dep_url, dep_key in zip(dep_urls, dep_keys)
+                            if dep_key not in claimed_repos]
 
-                    # 재귀 호출 (깊이 제한 없음!)
-                    download_package_swift(dep_url, root_repo_key, depth + 1)
-                    time.sleep(0.2)  # API 레이트 리밋 방지 (더 빠르게)
-        else:
-            print(f"{indent}📦 {repo_key}: 의존성 없음")
+        skipped = len(dep_urls) - len(new_dep_urls)
+        if skipped:
+            print(f"{indent}🔄 {repo_key}: 이미 처리된 의존성 {skipped}개 건너뜀")
 
-        return True
+        # 하위 의존성은 재귀 대신 호출자가 작업 큐에 넣음 (깊이 제한 없음)
+        return new_dep_urls
 
     except Exception as e:
-        if 'repo_key' in locals():
+        with state_lock:
             failed_repos.add(repo_key)
-            print(f"{indent}❌ {repo_key}: {str(e)[:50]}...")
-        stats['failed_downloads'] += 1
-        return False
+            stats['failed_downloads'] += 1
+        print(f"{indent}❌ {repo_key}: {str(e)[:50]}...")
+        return []
+
+
+def download_batch(token, tasks):
+    """작업 묶음의 Package.swift를 GraphQL 한 번으로 받아 저장하고 하위 작업 목록 반환"""
+    pending = []
+    for github_url, root_repo_key, depth in tasks:
+        repo_key = claim_repo(github_url, depth)
+        if repo_key:
+            pending.append((repo_key, root_repo_key, depth))
+
+    if not pending:
+        return []
+
+    # 캐시가 있는 리포지토리도 묶음에 포함 (변경 여부는 blob oid로 확인)
+    try:
+        prefetched = fetch_package_swift_graphql([repo_key for repo_key, _, _ in pending], token)
+    except Exception as e:
+        print(f"⚠️  GraphQL 조회 실패, REST로 재시도: {str(e)[:50]}...")
+        prefetched = {}
+
+    child_tasks = []
+    for repo_key, root_repo_key, depth in pending:
+        for dep_url in download_package_swift(token, repo_key, root_repo_key, depth, prefetched):
+            child_tasks.append((dep_url, root_repo_key, depth + 1))
+
+    return child_tasks
+
+
+def finish_root_tasks(tasks, child_tasks):
+    """처리한 작업과 새 하위 작업을 루트별 남은 작업 수에 반영하고, 하위 트리가 끝난 루트 수 반환
+
+    하위 작업을 큐에 넣기 전에 호출해야 다른 작업자가 먼저 처리해 개수가 어긋나지 않는다.
+    """
+    finished = 0
+    with state_lock:
+        for _, root_repo_key, _ in child_tasks:
+            root_pending_tasks[root_repo_key] += 1
+        for _, root_repo_key, _ in tasks:
+            root_pending_tasks[root_repo_key] -= 1
+            if root_pending_tasks[root_repo_key] == 0:
+                finished += 1
+    return finished
+
+
+def report_root_progress(total_roots):
+    """루트 리포지토리의 하위 트리 전체가 처리될 때마다 진행률 출력"""
+    global completed_roots
+
+    with state_lock:
+        completed_roots += 1
+        processed_count = completed_roots
+        success_count = len(processed_repos)
+
+    progress = (processed_count / total_roots) * 100
+    print(f"\n📊 루트 진행률: {processed_count}/{total_roots} ({progress:.1f}%)")
+
+    # 진행 상황 출력
+    if processed_count % 10 == 0:
+        elapsed = time.time() - stats['start_time']
+        avg_time = elapsed / processed_count
+        estimated_total = avg_time * total_roots
+        remaining = estimated_total - elapsed
+
+        print(f"⏱️  경과 시간: {elapsed / 60:.1f}분, 예상 남은 시간: {remaining / 60:.1f}분")
+        print(f"📈 현재 성공 리포지토리: {success_count}개")
+
+
+def worker(token, total_roots):
+    """토큰 하나에 고정된 작업자: 큐에서 작업 묶음을 꺼내 처리하고 하위 의존성을 다시 큐에 넣음
+
+    모든 요청에 같은 토큰을 사용하여 레이트 리밋을 토큰 단위로 분리한다.
+    """
+    stop = False
+
+    while not stop:
+        # 첫 작업은 대기하며 가져오고, 나머지는 큐에 쌓인 만큼 GraphQL 배치 크기까지 묶음
+        items = [task_queue.get()]
+        while len(items) < GRAPHQL_BATCH_SIZE:
+            try:
+                items.append(task_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        tasks = [item for item in items if item is not None]
+        sentinels = len(items) - len(tasks)
+        stop = sentinels > 0
+
+        # 다른 작업자의 종료 신호까지 가져왔다면 되돌려 놓음
+        for _ in range(sentinels - 1):
+            task_queue.put(None)
+
+        child_tasks = []
+        try:
+            if tasks:
+                child_tasks = download_batch(token, tasks)
+        except Exception as e:
+            # 예외가 나도 작업자는 계속 동작해야 큐가 비워지고 join()이 끝남
+            print(f"❌ 작업 묶음 {len(tasks)}개 처리 실패 (하위 작업 유실): {str(e)[:80]}...")
+
+        try:
+            finished_roots = finish_root_tasks(tasks, child_tasks)
+            for child_task in child_tasks:
+                task_queue.put(child_task)
+            for _ in range(finished_roots):
+                report_root_progress(total_roots)
+        finally:
+            for _ in items:
+                task_queue.task_done()
 
 
 def process_all_repositories():
-    """CSV의 모든 리포지토리 처리"""
+    """CSV의 모든 리포지토리 처리 (토큰별 작업자로 병렬 처리)"""
     csv_file = "swift_spm_networking_repos.csv"
 
     try:
@@ -284,43 +544,40 @@ def process_all_repositories():
     stats['total_repos'] = len(df)
     stats['start_time'] = time.time()
 
-    print(f"🚀 총 {len(df)}개의 리포지토리 처리를 시작합니다!")
+    # 이전 실행의 ETag 캐시가 있으면 변경되지 않은 파일은 다시 받지 않음
+    load_fetch_cache()
+
+    print(f"🚀 총 {len(df)}개의 리포지토리 처리를 시작합니다! (작업자 {len(TOKENS)}개)")
     print(f"📁 저장 위치: {os.path.abspath(base_dir)}")
     print("=" * 80)
 
-    # 진행률 표시를 위한 변수
-    processed_count = 0
-
+    # 루트 리포지토리들을 작업 큐에 등록 (진행률은 루트의 하위 트리 전체가 끝났을 때 집계)
+    root_tasks = []
     for index, row in df.iterrows():
-        processed_count += 1
         github_url = row['url']
-        repo_name = row['repo']
-
-        # 진행률 표시
-        progress = (processed_count / len(df)) * 100
-        print(f"\n📊 진행률: {processed_count}/{len(df)} ({progress:.1f}%)")
-        print(f"🔍 [{processed_count}] {repo_name} 처리 중...")
-
-        # 루트 리포지토리로 처리
         owner, repo = extract_repo_info(github_url)
         if owner and repo:
             root_repo_key = f"{owner}/{repo}"
-            download_package_swift(github_url, root_repo_key, 0)
+            root_tasks.append((github_url, root_repo_key, 0))
+            root_pending_tasks[root_repo_key] = root_pending_tasks.get(root_repo_key, 0) + 1
 
-        # 진행 상황 출력
-        if processed_count % 10 == 0:
-            elapsed = time.time() - stats['start_time']
-            avg_time = elapsed / processed_count
-            estimated_total = avg_time * len(df)
-            remaining = estimated_total - elapsed
+    total_roots = len(root_pending_tasks)
+    for root_task in root_tasks:
+        task_queue.put(root_task)
 
-            print(f"⏱️  경과 시간: {elapsed / 60:.1f}분, 예상 남은 시간: {remaining / 60:.1f}분")
-            print(
-                f"📈 현재 성공률: {len(processed_repos)}/{processed_count} ({len(processed_repos) / processed_count * 100:.1f}%)")
+    with ThreadPoolExecutor(max_workers=len(TOKENS)) as executor:
+        futures = [executor.submit(worker, token, total_roots) for token in TOKENS]
 
-        # API 레이트 리밋을 위한 대기
-        time.sleep(0.5)
+        # 모든 작업(하위 의존성 포함)이 끝나면 작업자 종료
+        task_queue.join()
+        for _ in TOKENS:
+            task_queue.put(None)
 
+        # 작업자 내부에서 처리되지 않은 예외가 있으면 여기서 드러냄
+        for future in futures:
+            future.result()
+
+    save_fetch_cache()
     stats['end_time'] = time.time()
 
 
@@ -362,13 +619,18 @@ def create_final_summary():
 
     # JSON 형태로도 저장
     json_path = os.path.join(base_dir, "dependency_graph.json")
-    with open(json_path, 'w') as f:
-        json.dump({
-            'stats': stats,
-            'dependency_graph': dependency_graph,
-            'processed_repos': list(processed_repos),
-            'failed_repos': list(failed_repos)
-        }, f, indent=2)
+    summary_data = {
+        'stats': stats,
+        'dependency_graph': dependency_graph,
+        'processed_repos': list(processed_repos),
+        'failed_repos': list(failed_repos)
+    }
+    if orjson is not None:
+        with open(json_path, 'wb') as f:
+            f.write(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w') as f:
+            json.dump(summary_data, f, indent=2)
 
     print(f"📊 최종 요약이 생성되었습니다:")
     print(f"   📄 {summary_path}")